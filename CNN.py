@@ -58,8 +58,9 @@ class CNN(nn.Module):
     def forward(self, X):
         out = self.conv_layers(X)
 
-        # Flatten
-        out = out.view(-1, 50176)
+        # Flatten (reshape, not view: channels_last activations are not
+        # contiguous in NCHW order)
+        out = out.reshape(-1, 50176)
 
         # Fully connected
         out = self.dense_layers(out)
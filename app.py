@@ -1,9 +1,22 @@
+import hashlib
+import io
 import os
+import queue
 import sys
+import threading
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Optional
 # Suppress warnings before importing other modules
 warnings.filterwarnings('ignore')
 
+# Cap the intra-op thread pool before torch initializes it: the default
+# (all cores) oversubscribes once several requests run concurrently
+INTRA_THREADS = int(os.environ.get('TORCH_INTRA_THREADS', '2'))
+os.environ.setdefault('OMP_NUM_THREADS', str(INTRA_THREADS))
+
 from flask import Flask, redirect, render_template, request, jsonify
 from flask_login import (
     LoginManager,
@@ -15,11 +28,37 @@ from flask_login import (
 )
 from PIL import Image
 import torchvision.transforms.functional as TF
+import torchvision.transforms as T
+from torchvision import io as tvio
 import CNN
 import numpy as np
 import torch
 import pandas as pd
 
+# This process only ever runs inference, so autograd is never needed
+torch.set_grad_enabled(False)
+torch.set_num_threads(INTRA_THREADS)
+try:
+    torch.set_num_interop_threads(1)
+except RuntimeError:
+    pass  # already initialized (e.g. re-import under a worker)
+
+# Decode + resize without the PIL round trip (saves the HWC->CHW copy);
+# scripted once so the per-request path is a single fused call
+try:
+    _preproc = torch.jit.script(torch.nn.Sequential(
+        T.ConvertImageDtype(torch.float),
+        T.Resize((224, 224), antialias=True),
+    ).eval())
+except Exception:
+    _preproc = None
+
+# ONNX Runtime is optional - fall back to TorchScript/eager if unavailable
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
 # Import warning suppression
 try:
     from suppress_warnings import *
@@ -41,10 +80,69 @@ from utils import (
 disease_info = pd.read_csv('disease_info.csv', encoding='cp1252')
 supplement_info = pd.read_csv('supplement_info.csv', encoding='cp1252')
 
+# Materialize the rows once so /submit does plain list indexing instead of
+# seven pandas Series lookups per request
+DISEASE_ROWS = disease_info.to_dict(orient='records')
+SUPPLEMENT_ROWS = supplement_info.to_dict(orient='records')
+
+# The market page context is static - build the lists once instead of
+# copying every Series out of pandas on each page load
+MARKET_CTX = dict(
+    supplement_image=supplement_info['supplement image'].tolist(),
+    supplement_name=supplement_info['supplement name'].tolist(),
+    disease=disease_info['disease_name'].tolist(),
+    buy=supplement_info['buy link'].tolist(),
+)
+
+# Soil data is static - parse the CSV once at startup so the soil/state
+# endpoints become dict lookups instead of per-request file reads
+try:
+    _soil_df = pd.read_csv('data/state_soil_data.csv')
+    SOIL_BY_STATE = {row['state']: row for row in _soil_df.to_dict(orient='records')}
+    STATES_SORTED = sorted(SOIL_BY_STATE)
+except Exception as e:
+    print(f"Could not load soil data: {e}")
+    SOIL_BY_STATE = {}
+    STATES_SORTED = []
+
+# Approximate state detection based on coordinates (India-specific).
+# One vectorized bounds check over all rules replaces the per-request
+# if-chain; np.argmax picks the first matching rule, so the closed-bound,
+# first-match-wins semantics of the old cascade are preserved exactly.
+_STATE_BOUNDS = [
+    ('Maharashtra', 15, 22, 72, 80),
+    ('Punjab', 28, 32, 74, 77),
+    ('Kerala', 9, 12, 75, 78),
+    ('West Bengal', 22, 27, 84, 88),
+    ('Tamil Nadu', 10, 14, 76, 80),
+    ('Uttar Pradesh', 23, 27, 80, 84),
+    ('Karnataka', 12, 19, 74, 78),
+    ('Gujarat', 20, 24, 72, 74),
+    ('Maharashtra', 18, 20, 73, 75),  # Mumbai region
+]
+_STATE_NAMES = [bounds[0] for bounds in _STATE_BOUNDS]
+_STATE_BOUNDS_ARR = np.array([bounds[1:] for bounds in _STATE_BOUNDS], dtype=np.float64)
+
+
+def _state_for_coords(lat, lon):
+    """Map coordinates to a state via the rule table (first match wins)"""
+    hits = ((_STATE_BOUNDS_ARR[:, 0] <= lat) & (lat <= _STATE_BOUNDS_ARR[:, 1])
+            & (_STATE_BOUNDS_ARR[:, 2] <= lon) & (lon <= _STATE_BOUNDS_ARR[:, 3]))
+    first = int(np.argmax(hits))
+    if hits[first]:
+        return _STATE_NAMES[first]
+    # Default to a common state if coordinates don't match any rule
+    return 'Maharashtra'
+
 # Initialize disease detection model
 model = CNN.CNN(39)
 # Fix MODEL_PATH to use relative path
 MODEL_PATH = os.path.join('Model', 'plant_disease_model_1_latest.pt')
+SCRIPTED_MODEL_PATH = os.path.join('Model', 'plant_disease_model_scripted.pt')
+# v2: exported with a dynamic batch axis; the old plant_disease.onnx was
+# pinned to batch 1 and rejected the micro-batcher's stacked inputs
+ONNX_MODEL_PATH = os.path.join('Model', 'plant_disease_v2.onnx')
+ort_session = None
 
 if not os.path.exists(MODEL_PATH):
     print("Model file not found at:", MODEL_PATH)
@@ -54,6 +152,69 @@ else:
     try:
         model.load_state_dict(torch.load(MODEL_PATH, map_location='cpu'))
         model.eval()
+        # oneDNN conv kernels are NHWC-native, so keep weights channels-last
+        # to avoid layout reorders inside every conv
+        model = model.to(memory_format=torch.channels_last)
+        # Prefer ONNX Runtime for CPU inference - export once, reuse on later boots
+        if ort is not None:
+            try:
+                if not os.path.exists(ONNX_MODEL_PATH):
+                    # The batch axis must stay dynamic: _forward_batch feeds
+                    # stacked batches of up to _BATCH_SIZE images
+                    torch.onnx.export(model, torch.randn(1, 3, 224, 224), ONNX_MODEL_PATH,
+                                      opset_version=17, input_names=['x'], output_names=['logits'],
+                                      dynamic_axes={'x': {0: 'batch'}, 'logits': {0: 'batch'}})
+                sess_options = ort.SessionOptions()
+                sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+                ort_session = ort.InferenceSession(ONNX_MODEL_PATH, sess_options,
+                                                   providers=['CPUExecutionProvider'])
+                print("Disease detection model running on ONNX Runtime")
+            except Exception as e:
+                ort_session = None
+                print(f"ONNX export/load failed, falling back to TorchScript: {e}")
+        # TorchScript-compile once at startup so per-request inference skips
+        # Python dispatch and benefits from operator fusion
+        compiled = False
+        if ort_session is None and hasattr(torch, 'compile'):
+            # On PyTorch 2.x Inductor fuses the conv+BN+ReLU chains and removes
+            # Python dispatch; shape is always 1x3x224x224 so keep it static
+            eager_model = model
+            try:
+                # Leave dynamic unset: the batch dimension varies (1.._BATCH_SIZE
+                # under the micro-batcher) and Inductor generalizes it after the
+                # first resize instead of compiling per batch size
+                model = torch.compile(model, mode='reduce-overhead')
+                # Warm-up forward triggers compilation now rather than on the
+                # first real request
+                model(torch.zeros(1, 3, 224, 224).contiguous(memory_format=torch.channels_last))
+                compiled = True
+                print("Disease detection model compiled with torch.compile")
+            except Exception as e:
+                model = eager_model
+                print(f"torch.compile failed, falling back to TorchScript: {e}")
+        if ort_session is None and not compiled:
+            # Dynamic INT8 quantization halves weight bandwidth for the big
+            # dense layers (50176x1024 dominates the model size) on CPU
+            try:
+                model = torch.ao.quantization.quantize_dynamic(
+                    model, {torch.nn.Linear}, dtype=torch.qint8)
+                print("Disease detection model quantized to INT8 (dynamic)")
+            except Exception as e:
+                print(f"Dynamic quantization failed, keeping FP32 weights: {e}")
+            try:
+                if os.path.exists(SCRIPTED_MODEL_PATH):
+                    model = torch.jit.load(SCRIPTED_MODEL_PATH, map_location='cpu')
+                else:
+                    scripted = torch.jit.script(model)
+                    scripted = torch.jit.optimize_for_inference(torch.jit.freeze(scripted))
+                    scripted.save(SCRIPTED_MODEL_PATH)
+                    model = scripted
+                # Warm-up forward pass so the JIT optimization passes run now
+                # instead of on the first real request
+                model(torch.zeros(1, 3, 224, 224))
+                print("Disease detection model compiled with TorchScript")
+            except Exception as e:
+                print(f"TorchScript compilation failed, using eager model: {e}")
         print("Disease detection model loaded successfully!")
     except Exception as e:
         print(f"Error loading disease detection model: {e}")
@@ -71,21 +232,144 @@ try:
 except Exception as e:
     print(f"Error loading agri forecasting model: {e}")
 
+# Micro-batching: concurrent /submit requests are collected for a short
+# window and run through the model as a single batch, so conv kernels
+# amortize framework overhead across requests under load
+_BATCH_SIZE = 8
+_BATCH_WINDOW_S = 0.005
+_predict_queue = queue.Queue()
+
+# Set SAVE_UPLOADS=1 to keep a copy of submitted images in static/uploads;
+# prediction itself runs from memory either way
+SAVE_UPLOADS = os.environ.get('SAVE_UPLOADS', '0').lower() in ('1', 'true', 'yes')
+# Shared pool for off-request-thread work (upload persistence, /predict helpers)
+_executor = ThreadPoolExecutor(max_workers=4)
+
+# Content-addressed prediction cache: repeat uploads of the same image
+# (demo images especially) skip the CNN forward entirely
+_PRED_CACHE = OrderedDict()
+_PRED_CACHE_MAX = 512
+_pred_cache_lock = threading.Lock()
+
+
+def _forward_batch(batch):
+    """Run one forward pass over a stacked (N,3,224,224) batch"""
+    if ort_session is not None:
+        # ORT needs a C-contiguous array; the buffers are channels_last
+        logits = ort_session.run(None, {'x': batch.contiguous().numpy()})[0]
+        return logits.argmax(axis=1).tolist()
+    # inference_mode also skips version counters and view tracking,
+    # so no autograd bookkeeping is allocated per request
+    with torch.inference_mode():
+        output = model(batch.contiguous(memory_format=torch.channels_last))
+    return output.argmax(dim=1).tolist()
+
+
+def _batch_worker():
+    """Drain the prediction queue, batching up to _BATCH_SIZE requests"""
+    while True:
+        items = [_predict_queue.get()]
+        while len(items) < _BATCH_SIZE:
+            try:
+                items.append(_predict_queue.get(timeout=_BATCH_WINDOW_S))
+            except queue.Empty:
+                break
+        try:
+            indices = _forward_batch(torch.cat([tensor for tensor, _, _ in items]))
+            for (_, slot, event), index in zip(items, indices):
+                slot['index'] = index
+                event.set()
+        except Exception as e:
+            for _, slot, event in items:
+                slot['error'] = e
+                event.set()
+
+
+threading.Thread(target=_batch_worker, daemon=True, name='predict-batch-worker').start()
+
+
+# Per-thread reusable (1,3,224,224) buffer so each request copies into an
+# existing tensor instead of allocating ~600KB. Safe to reuse because the
+# handler blocks on its Event until the batch worker has consumed the buffer.
+_input_buffers = threading.local()
+
+
+def _input_buffer():
+    buf = getattr(_input_buffers, 'buf', None)
+    if buf is None:
+        buf = torch.empty(1, 3, 224, 224, memory_format=torch.channels_last)
+        _input_buffers.buf = buf
+    return buf
+
+
+def _predict_tensor(input_data):
+    """Hand a (1,3,224,224) tensor to the batching worker and wait for the result"""
+    buf = _input_buffer()
+    buf.copy_(input_data)
+    slot = {}
+    event = threading.Event()
+    _predict_queue.put((buf, slot, event))
+    event.wait()
+    if 'error' in slot:
+        raise slot['error']
+    return slot['index']
+
+
 def prediction(image_path):
-    """Predict plant disease from image"""
-    image = Image.open(image_path)
-    image = image.resize((224, 224))
-    input_data = TF.to_tensor(image)
-    input_data = input_data.view((-1, 3, 224, 224))
-    output = model(input_data)
-    output = output.detach().numpy()
-    index = np.argmax(output)
-    return index
+    """Predict plant disease from an image file on disk"""
+    input_data = None
+    if _preproc is not None:
+        try:
+            input_data = _preproc(tvio.read_image(image_path, tvio.ImageReadMode.RGB))
+        except (RuntimeError, OSError):
+            input_data = None  # format torchvision.io can't decode - use PIL
+    if input_data is None:
+        image = Image.open(image_path)
+        image = image.resize((224, 224))
+        input_data = TF.to_tensor(image)
+    return _predict_tensor(input_data.unsqueeze(0))
+
+
+def prediction_from_pil(image):
+    """Predict plant disease from an already-decoded PIL image"""
+    if _preproc is not None:
+        input_data = _preproc(TF.pil_to_tensor(image))
+    else:
+        input_data = TF.to_tensor(image.resize((224, 224)))
+    return _predict_tensor(input_data.unsqueeze(0))
 
 # Initialize Flask app
 app = Flask(__name__)
 app.secret_key = os.environ.get('FLASK_SECRET_KEY', 'dev-secret-key')
 
+# orjson serializes the float/dict-heavy API payloads several times faster
+# than stdlib json; OPT_SERIALIZE_NUMPY also handles numpy scalars directly
+try:
+    import orjson
+    from flask.json.provider import JSONProvider
+
+    class ORJSONProvider(JSONProvider):
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+except ImportError:
+    pass  # stdlib json provider remains the default
+
+# Compile the hot templates once at startup and skip the per-render mtime
+# check; a missing template still surfaces at request time as before
+app.jinja_env.auto_reload = False
+for _template in ('home.html', 'index.html', 'market.html', 'submit.html',
+                  'login.html', 'signup.html', 'yield_forecast.html',
+                  'carbon_calculator.html', 'contact-us.html', 'mobile-device.html'):
+    try:
+        app.jinja_env.get_template(_template)
+    except Exception:
+        pass
+
 # ==================== Auth: Flask-Login Setup ====================
 
 class User(UserMixin):
@@ -99,20 +383,23 @@ class User(UserMixin):
         return str(self.id)
 
 
-# Simple in-memory user store for testing
+# Simple in-memory user store for testing; keys are canonical lowercase
 USERS = {
     'rutugandh': {'id': 1, 'username': 'rutugandh', 'name': 'Rutugandh Kulkarni', 'password': '1234'},
 }
 
+# Reverse index so load_user (called on every @login_required request)
+# is a single dict lookup instead of a scan over USERS
+USERS_BY_ID = {str(u['id']): u for u in USERS.values()}
+
 login_manager = LoginManager(app)
 login_manager.login_view = 'login'
 
 @login_manager.user_loader
 def load_user(user_id):
-    # Find user by id in USERS
-    for u in USERS.values():
-        if str(u['id']) == str(user_id):
-            return User(u['id'], u['username'], u['name'], u['password'])
+    u = USERS_BY_ID.get(str(user_id))
+    if u is not None:
+        return User(u['id'], u['username'], u['name'], u['password'])
     return None
 
 # ==================== Disease Detection Routes ====================
@@ -136,9 +423,8 @@ def login():
         username = (request.form.get('username') or '').strip()
         password = (request.form.get('password') or '').strip()
 
-        # Case-insensitive username lookup
-        key = username.lower()
-        user_rec = USERS.get(key) or USERS.get(username)
+        # Case-insensitive username lookup (USERS keys are lowercase)
+        user_rec = USERS.get(username.lower())
         if user_rec and password == user_rec['password']:
             user = User(user_rec['id'], user_rec['username'], user_rec['name'], user_rec['password'])
             login_user(user)
@@ -187,32 +473,39 @@ def submit():
     """Submit image for disease detection"""
     if request.method == 'POST':
         image = request.files['image']
-        filename = image.filename
-        file_path = os.path.join('static/uploads', filename)
-        image.save(file_path)
-        print(file_path)
-        pred = prediction(file_path)
-        title = disease_info['disease_name'][pred]
-        description = disease_info['description'][pred]
-        prevent = disease_info['Possible Steps'][pred]
-        image_url = disease_info['image_url'][pred]
-        supplement_name = supplement_info['supplement name'][pred]
-        supplement_image_url = supplement_info['supplement image'][pred]
-        supplement_buy_link = supplement_info['buy link'][pred]
-        print("CSV Columns:", supplement_info.columns.tolist())
-        return render_template('submit.html', title=title, desc=description, prevent=prevent,
-                               image_url=image_url, pred=pred, sname=supplement_name,
-                               simage=supplement_image_url, buy_link=supplement_buy_link)
+        data = image.read()
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        with _pred_cache_lock:
+            pred = _PRED_CACHE.get(digest)
+            if pred is not None:
+                _PRED_CACHE.move_to_end(digest)
+        if pred is None:
+            # Decode straight from memory - no write+re-read round trip
+            pil_image = Image.open(io.BytesIO(data)).convert('RGB')
+            if SAVE_UPLOADS and image.filename:
+                # Persist off the request thread; prediction doesn't need the file
+                file_path = os.path.join('static/uploads', image.filename)
+                _executor.submit(pil_image.save, file_path)
+            pred = prediction_from_pil(pil_image)
+            with _pred_cache_lock:
+                _PRED_CACHE[digest] = pred
+                if len(_PRED_CACHE) > _PRED_CACHE_MAX:
+                    _PRED_CACHE.popitem(last=False)
+        disease_row = DISEASE_ROWS[pred]
+        supplement_row = SUPPLEMENT_ROWS[pred]
+        return render_template('submit.html', title=disease_row['disease_name'],
+                               desc=disease_row['description'],
+                               prevent=disease_row['Possible Steps'],
+                               image_url=disease_row['image_url'], pred=pred,
+                               sname=supplement_row['supplement name'],
+                               simage=supplement_row['supplement image'],
+                               buy_link=supplement_row['buy link'])
 
 @app.route('/market', methods=['GET', 'POST'])
 @login_required
 def market():
     """Market/supplements page"""
-    return render_template('market.html',
-                           supplement_image=list(supplement_info['supplement image']),
-                           supplement_name=list(supplement_info['supplement name']),
-                           disease=list(disease_info['disease_name']),
-                           buy=list(supplement_info['buy link']))
+    return render_template('market.html', **MARKET_CTX)
 
 # ==================== Agri Forecasting Routes ====================
 
@@ -228,6 +521,20 @@ def yield_forecast_page():
 def carbon_calculator():
     return render_template('carbon_calculator.html')
 
+@dataclass(slots=True)
+class YieldInput:
+    """Typed container for /predict inputs - coerced once per request"""
+    state: str
+    N: float
+    P: float
+    K: float
+    pH: float
+    avg_temp_c: float
+    total_rainfall_mm: float
+    avg_humidity_percent: float
+    year: Optional[int] = None
+
+
 @app.route('/predict', methods=['POST'])
 def predict_yield():
     """Predict crop yield and return recommendations."""
@@ -236,25 +543,32 @@ def predict_yield():
             return jsonify({'error': 'Model not loaded. Please train the model first.', 'success': False})
 
         data = request.json or {}
-        
-        # Validate required fields quickly (use your util validation)
+
+        # Validate required fields before any numeric coercion
         validation = validate_input_parameters(data)
         if not validation['success']:
             return jsonify({'error': 'Invalid input', 'details': validation['errors'], 'success': False})
 
-        # Build input_data dict (ensure numeric types)
-        input_data = {
-            'state': data.get('state', ''),
-            'N': float(data.get('N', 0)),
-            'P': float(data.get('P', 0)),
-            'K': float(data.get('K', 0)),
-            'pH': float(data.get('pH', 7)),
-            'avg_temp_c': float(data.get('avg_temp_c', 25)),
-            'total_rainfall_mm': float(data.get('total_rainfall_mm', 0)),
-            'avg_humidity_percent': float(data.get('avg_humidity_percent', 50))
-        }
-        if 'year' in data:
-            input_data['year'] = int(data['year'])
+        # Coerce the numeric fields exactly once
+        inp = YieldInput(
+            state=data.get('state', ''),
+            N=float(data.get('N', 0)),
+            P=float(data.get('P', 0)),
+            K=float(data.get('K', 0)),
+            pH=float(data.get('pH', 7)),
+            avg_temp_c=float(data.get('avg_temp_c', 25)),
+            total_rainfall_mm=float(data.get('total_rainfall_mm', 0)),
+            avg_humidity_percent=float(data.get('avg_humidity_percent', 50)),
+            year=int(data['year']) if 'year' in data else None,
+        )
+        input_data = asdict(inp)
+        if inp.year is None:
+            del input_data['year']
+
+        # Farming tips only depend on the inputs (the helpers read disjoint
+        # keys from input_data), so run them on the pool while the
+        # forecaster and summary run on the request thread
+        tips_future = _executor.submit(generate_farming_tips, input_data, input_data)
 
         # Predict
         prediction_raw = forecaster.predict(input_data)
@@ -264,11 +578,7 @@ def predict_yield():
         summary = format_prediction_summary(prediction, input_data)
 
         # Farming tips (friendly list)
-        farming_tips = generate_farming_tips(
-            {'N': input_data['N'], 'P': input_data['P'], 'K': input_data['K'], 'pH': input_data['pH']},
-            {'avg_temp_c': input_data['avg_temp_c'], 'total_rainfall_mm': input_data['total_rainfall_mm'],
-             'avg_humidity_percent': input_data['avg_humidity_percent']}
-        )
+        farming_tips = tips_future.result()
 
         # Return structured response (friendly for frontend)
         return jsonify({
@@ -345,38 +655,33 @@ def get_weather_by_coords():
 @app.route('/states')
 def get_states():
     """Get list of available states"""
-    try:
-        # Read soil data to get available states
-        soil_data = pd.read_csv('data/state_soil_data.csv')
-        states = sorted(soil_data['state'].unique().tolist())
-        return jsonify({
-            'states': states,
-            'success': True
-        })
-    except Exception as e:
+    if not STATES_SORTED:
         return jsonify({
-            'error': f'Error loading states: {str(e)}',
+            'error': 'Error loading states: soil data not available',
             'success': False
         })
+    return jsonify({
+        'states': STATES_SORTED,
+        'success': True
+    })
 
 @app.route('/soil-data/<state>')
 def get_soil_data(state):
     """Get soil data for a specific state"""
     try:
-        soil_data = pd.read_csv('data/state_soil_data.csv')
-        state_soil = soil_data[soil_data['state'] == state]
-        
-        if state_soil.empty:
+        row = SOIL_BY_STATE.get(state)
+
+        if row is None:
             return jsonify({
                 'error': f'No soil data found for state: {state}',
                 'success': False
             })
-        
+
         soil_info = {
-            'N': float(state_soil['N'].iloc[0]),
-            'P': float(state_soil['P'].iloc[0]),
-            'K': float(state_soil['K'].iloc[0]),
-            'pH': float(state_soil['pH'].iloc[0])
+            'N': float(row['N']),
+            'P': float(row['P']),
+            'K': float(row['K']),
+            'pH': float(row['pH'])
         }
         
         return jsonify({
@@ -418,41 +723,16 @@ def get_soil_by_coords():
         
         # Approximate state detection based on coordinates (India-specific)
         # This is a simplified mapping - in production, use a proper geocoding service
-        state = None
-        if 15 <= lat <= 22 and 72 <= lon <= 80:
-            state = 'Maharashtra'
-        elif 28 <= lat <= 32 and 74 <= lon <= 77:
-            state = 'Punjab'
-        elif 9 <= lat <= 12 and 75 <= lon <= 78:
-            state = 'Kerala'
-        elif 22 <= lat <= 27 and 84 <= lon <= 88:
-            state = 'West Bengal'
-        elif 10 <= lat <= 14 and 76 <= lon <= 80:
-            state = 'Tamil Nadu'
-        elif 23 <= lat <= 27 and 80 <= lon <= 84:
-            state = 'Uttar Pradesh'
-        elif 12 <= lat <= 19 and 74 <= lon <= 78:
-            state = 'Karnataka'
-        elif 20 <= lat <= 24 and 72 <= lon <= 74:
-            state = 'Gujarat'
-        elif 18 <= lat <= 20 and 73 <= lon <= 75:
-            state = 'Maharashtra'  # Mumbai region
-        else:
-            # Default to a common state if coordinates don't match
-            state = 'Maharashtra'
+        state = _state_for_coords(lat, lon)
         
-        # Load soil data
-        soil_data = pd.read_csv('data/state_soil_data.csv')
-        state_soil = soil_data[soil_data['state'] == state]
-        
-        if state_soil.empty:
+        # Look up preloaded soil data
+        row = SOIL_BY_STATE.get(state)
+
+        if row is None:
             return jsonify({
                 'error': f'No soil data found for coordinates ({lat}, {lon})',
                 'success': False
             })
-        
-        # Get available data
-        row = state_soil.iloc[0]
         pH_value = float(row['pH']) if 'pH' in row and pd.notna(row['pH']) else None
         
         # Estimate soil type based on pH and region (simplified logic)
@@ -589,8 +869,9 @@ if __name__ == '__main__':
         print("="*60 + "\n")
     
     print("\n" + "="*60)
-    print("Starting Flask application...")
+    print("Starting Flask application (development server)...")
     print("Server running on http://127.0.0.1:5000")
+    print("For production use: gunicorn -c gunicorn.conf.py app:app")
     print("Press CTRL+C to stop the server")
     print("="*60 + "\n")
     
@@ -0,0 +1,27 @@
+"""
+Gunicorn configuration for production serving
+
+The Werkzeug dev server in app.py is single-process and GIL-bound; serve
+production traffic with:
+
+    gunicorn -c gunicorn.conf.py app:app
+"""
+import multiprocessing
+
+bind = '0.0.0.0:5000'
+workers = min(4, multiprocessing.cpu_count())
+worker_class = 'gthread'
+threads = 2
+# Each worker imports app (and loads its own model) after fork - no shared
+# PyTorch state across processes
+preload_app = False
+
+
+def post_fork(server, worker):
+    # Cap intra-op threads per worker so workers x torch threads doesn't
+    # oversubscribe the CPUs. Set via env rather than torch directly: the
+    # worker imports app.py after this hook, and app.py applies
+    # TORCH_INTRA_THREADS at import time (a direct set_num_threads here
+    # would be overridden by that import).
+    import os
+    os.environ.setdefault('TORCH_INTRA_THREADS', '1')
@@ -2,7 +2,6 @@
 Production-ready script to run the Flask app
 This script suppresses warnings and provides cleaner output
 """
-import os
 import sys
 import warnings
 import logging
@@ -12,7 +11,6 @@ warnings.filterwarnings('ignore')
 
 # Suppress Flask/Werkzeug logging
 logging.getLogger('werkzeug').setLevel(logging.ERROR)
-os.environ['WERKZEUG_RUN_MAIN'] = 'true'
 
 # Import and run the app
 if __name__ == '__main__':
@@ -26,13 +24,19 @@ if __name__ == '__main__':
     
     # Import app after setting up environment
     from app import app
-    
-    # Run without reloader to avoid duplicate output
-    app.run(
-        debug=True,
-        host='0.0.0.0',
-        port=5000,
-        use_reloader=False,
-        threaded=True
-    )
+
+    # Serve with waitress (a real threaded WSGI server, Windows-friendly)
+    # when it is installed; the Flask dev server stays as the fallback
+    try:
+        from waitress import serve
+        serve(app, host='0.0.0.0', port=5000, threads=8, connection_limit=256)
+    except ImportError:
+        # Run without reloader to avoid duplicate output
+        app.run(
+            debug=True,
+            host='0.0.0.0',
+            port=5000,
+            use_reloader=False,
+            threaded=True
+        )
 
@@ -5,7 +5,132 @@ This module contains helper functions for agricultural predictions and recommend
 Extracted from app.py to keep the main application clean and modular.
 """
 
-from typing import Dict, List, Optional
+import numpy as np
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+# Numba is optional: the weather mask kernels below are pure float
+# compares and run fine (just slower) as plain Python without it
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+# Threshold tables for get_soil_health_assessment - a two-compare grade and
+# a tuple read per nutrient instead of rebuilding branch/string literals on
+# every call. Each entry: ((low_cutoff, high_cutoff), recs per grade).
+_NUTRIENT_LABELS = ('Low', 'Adequate', 'High')
+_NUTRIENT_TABLES = {
+    'nitrogen': ((200, 400),
+                 ("Add nitrogen fertilizers (urea/ammonium sulfate)",
+                  None,
+                  "Reduce nitrogen fertilizer, risk of leaf burn")),
+    'phosphorus': ((15, 50),
+                   ("Add phosphorus fertilizers (DAP/SSP)",
+                    None,
+                    "Reduce phosphorus, may cause zinc deficiency")),
+    'potassium': ((150, 300),
+                  ("Add potassium fertilizers (MOP/SOP)",
+                   None,
+                   "Reduce potassium fertilizer application")),
+}
+
+
+# pH recommendation constants shared by get_soil_health_assessment
+_PH_REC_LIME = "Add lime to increase pH (target: 6.0-7.0)"
+_PH_REC_SULFUR = "Add sulfur or organic matter to reduce pH"
+
+# Farming tip messages (generate_farming_tips); returning references to
+# these module-level constants keeps equality checks pointer-cheap and
+# avoids reconstructing the emoji-prefixed literals per call
+_TIP_ORGANIC_N = "🌿 Consider organic nitrogen sources like compost or vermicompost for sustainable soil improvement"
+_TIP_LIME = "🧪 Apply agricultural lime 2-3 months before planting to improve soil pH"
+_TIP_SULFUR = "🧪 Add organic matter or sulfur to reduce soil alkalinity"
+_TIP_VENTILATION = "🦠 High temperature and humidity favor disease development - ensure good field ventilation"
+_TIP_DROUGHT = "💧 Consider drought-tolerant crop varieties and water-efficient irrigation methods"
+_TIP_DRAINAGE = "🌊 Ensure adequate drainage and consider raised bed cultivation"
+_STATIC_TIPS = (
+    "📅 Plan crop rotation to maintain soil health and reduce pest buildup",
+    "🌱 Use certified seeds and follow recommended spacing for optimal yield",
+)
+# Bit order for generate_farming_tips' condition mask
+_CONDITIONAL_TIPS = (_TIP_ORGANIC_N, _TIP_LIME, _TIP_SULFUR,
+                     _TIP_VENTILATION, _TIP_DROUGHT, _TIP_DRAINAGE)
+
+# (field, min, max, range error message) specs for validate_input_parameters
+_VALIDATION_SPECS = (
+    ('N', 0, 1000, "Nitrogen value should be between 0-1000 mg/kg"),
+    ('P', 0, 200, "Phosphorus value should be between 0-200 mg/kg"),
+    ('K', 0, 1000, "Potassium value should be between 0-1000 mg/kg"),
+    ('pH', 0, 14, "pH value should be between 0-14"),
+    ('avg_temp_c', -10, 60, "Temperature should be between -10°C to 60°C"),
+    ('total_rainfall_mm', 0, 5000, "Rainfall should be between 0-5000 mm"),
+    ('avg_humidity_percent', 0, 100, "Humidity should be between 0-100%"),
+)
+
+# Yield category bins shared by the scalar and batch summary paths; the
+# digitize boundaries match get_yield_category's strict < comparisons
+_YIELD_BINS = (1500, 3000, 4500)
+_YIELD_LABELS = ('Low Yield', 'Medium Yield', 'Good Yield', 'Excellent Yield')
+
+
+@dataclass(slots=True)
+class SoilAssessment:
+    """Fixed-shape soil assessment; slots avoid a per-instance __dict__
+    when batch formatting builds thousands of these"""
+    overall_health: str
+    nitrogen: str
+    phosphorus: str
+    potassium: str
+    ph_status: str
+    recommendations: Tuple[str, ...]
+
+    def to_dict(self) -> Dict:
+        """Legacy mapping shape returned at the API boundary"""
+        return {
+            'overall_health': self.overall_health,
+            'recommendations': list(self.recommendations),
+            'nutrient_status': {
+                'nitrogen': self.nitrogen,
+                'phosphorus': self.phosphorus,
+                'potassium': self.potassium,
+            },
+            'ph_status': self.ph_status,
+        }
+
+
+@dataclass(slots=True)
+class WeatherRisk:
+    """Fixed-shape weather risk assessment"""
+    risk_level: str
+    risks: Tuple[str, ...]
+    recommendations: Tuple[str, ...]
+
+    def to_dict(self) -> Dict:
+        """Legacy mapping shape returned at the API boundary"""
+        return {
+            'risk_level': self.risk_level,
+            'risks': list(self.risks),
+            'recommendations': list(self.recommendations),
+        }
+
+
+def _grade(value: float, bounds) -> int:
+    """Grade a value against (low, high) cutoffs: 0=Low, 1=Adequate, 2=High"""
+    lo, hi = bounds
+    if value < lo:
+        return 0
+    if value > hi:
+        return 2
+    return 1
 
 
 def get_irrigation_recommendation(rainfall_mm: float, crop_water_need: float = 40.0) -> str:
@@ -31,18 +156,8 @@ def get_irrigation_recommendation(rainfall_mm: float, crop_water_need: float = 4
         return "✅ No irrigation needed (rainfall sufficient)"
 
 
-def suggest_crop_cycle(temp: float, rainfall: float) -> str:
-    """
-    Suggest appropriate crop cycle based on temperature and rainfall
-    
-    Args:
-        temp (float): Average temperature in Celsius
-        rainfall (float): Total rainfall in mm
-    
-    Returns:
-        str: Crop cycle recommendation
-    """
-    # Define crop cycle recommendations based on climate conditions
+def _crop_cycle_rules(temp: float, rainfall: float) -> str:
+    """Original crop cycle rule cascade - used once to build _CYCLE_LUT"""
     if temp < 20 and rainfall < 800:
         return "🌾 Winter Wheat → Plant in Nov-Dec, Harvest in Mar-Apr"
     elif 20 <= temp < 25 and 800 <= rainfall < 1200:
@@ -59,6 +174,59 @@ def suggest_crop_cycle(temp: float, rainfall: float) -> str:
         return "🌱 Variable Conditions → Consult local agricultural extension office"
 
 
+# Every rule boundary lies on one of these edges, so the cascade is
+# constant within each (temp, rain) cell and one evaluation per cell at
+# import reproduces it exactly; call time is then two bisects + an index
+_T_EDGES = (20, 25, 28, 30)
+_R_EDGES = (800, 1000, 1200, 1500, 1800)
+_CYCLE_LUT = tuple(
+    tuple(_crop_cycle_rules(t, r) for r in (400, 900, 1100, 1350, 1650, 2000))
+    for t in (15, 22.5, 26.5, 29, 32)
+)
+
+
+# String pieces for the vectorized irrigation path; category 2 is a fixed
+# message with no number, so its pieces stay empty and np.where swaps it in
+_IRR_PREFIXES = np.array(["💧 Irrigation needed: ", "⚠️ Monitor closely: ", ""])
+_IRR_SUFFIXES = np.array([" mm more per day", " mm rainfall (barely sufficient)", ""])
+_IRR_SUFFICIENT = "✅ No irrigation needed (rainfall sufficient)"
+
+
+def get_irrigation_recommendation_batch(rainfall_mm, crop_water_need: float = 40.0):
+    """
+    Vectorized get_irrigation_recommendation over an array of rainfall values
+
+    Args:
+        rainfall_mm: array-like of total rainfall values in millimeters
+        crop_water_need (float): Crop water requirement in mm (default: 40mm daily)
+
+    Returns:
+        np.ndarray: one recommendation string per input value
+    """
+    daily = np.asarray(rainfall_mm, dtype=np.float64) / 30.0
+    deficit = crop_water_need - daily
+    cat = np.where(daily < crop_water_need, 0,
+                   np.where(daily < crop_water_need * 1.2, 1, 2))
+    num = np.char.mod('%.1f', np.where(cat == 0, deficit, daily))
+    messages = np.char.add(np.char.add(np.take(_IRR_PREFIXES, cat), num),
+                           np.take(_IRR_SUFFIXES, cat))
+    return np.where(cat == 2, _IRR_SUFFICIENT, messages)
+
+
+def suggest_crop_cycle(temp: float, rainfall: float) -> str:
+    """
+    Suggest appropriate crop cycle based on temperature and rainfall
+
+    Args:
+        temp (float): Average temperature in Celsius
+        rainfall (float): Total rainfall in mm
+
+    Returns:
+        str: Crop cycle recommendation
+    """
+    return _CYCLE_LUT[bisect_right(_T_EDGES, temp)][bisect_right(_R_EDGES, rainfall)]
+
+
 def get_soil_health_assessment(n: float, p: float, k: float, ph: float) -> Dict:
     """
     Assess soil health based on NPK values and pH
@@ -72,67 +240,54 @@ def get_soil_health_assessment(n: float, p: float, k: float, ph: float) -> Dict:
     Returns:
         dict: Soil health assessment with recommendations
     """
-    assessment = {
-        'overall_health': 'Good',
-        'recommendations': [],
-        'nutrient_status': {}
-    }
-    
-    # Assess Nitrogen levels
-    if n < 200:
-        assessment['nutrient_status']['nitrogen'] = 'Low'
-        assessment['recommendations'].append("Add nitrogen fertilizers (urea/ammonium sulfate)")
-    elif n > 400:
-        assessment['nutrient_status']['nitrogen'] = 'High'
-        assessment['recommendations'].append("Reduce nitrogen fertilizer, risk of leaf burn")
-    else:
-        assessment['nutrient_status']['nitrogen'] = 'Adequate'
-    
-    # Assess Phosphorus levels
-    if p < 15:
-        assessment['nutrient_status']['phosphorus'] = 'Low'
-        assessment['recommendations'].append("Add phosphorus fertilizers (DAP/SSP)")
-    elif p > 50:
-        assessment['nutrient_status']['phosphorus'] = 'High'
-        assessment['recommendations'].append("Reduce phosphorus, may cause zinc deficiency")
-    else:
-        assessment['nutrient_status']['phosphorus'] = 'Adequate'
-    
-    # Assess Potassium levels
-    if k < 150:
-        assessment['nutrient_status']['potassium'] = 'Low'
-        assessment['recommendations'].append("Add potassium fertilizers (MOP/SOP)")
-    elif k > 300:
-        assessment['nutrient_status']['potassium'] = 'High'
-        assessment['recommendations'].append("Reduce potassium fertilizer application")
-    else:
-        assessment['nutrient_status']['potassium'] = 'Adequate'
-    
+    return assess_soil_health(n, p, k, ph).to_dict()
+
+
+def assess_soil_health(n: float, p: float, k: float, ph: float) -> SoilAssessment:
+    """Slots-object variant of get_soil_health_assessment for hot paths"""
+    recommendations = []
+
+    # Assess NPK levels against the precomputed threshold tables
+    grades = []
+    for (nutrient, (bounds, recs)), value in zip(_NUTRIENT_TABLES.items(), (n, p, k)):
+        grade = _grade(value, bounds)
+        grades.append(grade)
+        if recs[grade]:
+            recommendations.append(recs[grade])
+
     # Assess pH levels
     if ph < 5.5:
-        assessment['ph_status'] = 'Too Acidic'
-        assessment['recommendations'].append("Add lime to increase pH (target: 6.0-7.0)")
+        ph_status = 'Too Acidic'
+        recommendations.append(_PH_REC_LIME)
     elif ph > 8.5:
-        assessment['ph_status'] = 'Too Alkaline'
-        assessment['recommendations'].append("Add sulfur or organic matter to reduce pH")
+        ph_status = 'Too Alkaline'
+        recommendations.append(_PH_REC_SULFUR)
     elif 6.0 <= ph <= 7.5:
-        assessment['ph_status'] = 'Optimal'
+        ph_status = 'Optimal'
     else:
-        assessment['ph_status'] = 'Acceptable'
-    
-    # Overall health assessment
-    low_nutrients = sum([1 for status in assessment['nutrient_status'].values() if status == 'Low'])
-    high_nutrients = sum([1 for status in assessment['nutrient_status'].values() if status == 'High'])
-    ph_issues = assessment['ph_status'] in ['Too Acidic', 'Too Alkaline']
-    
+        ph_status = 'Acceptable'
+
+    # Overall health assessment - count grades directly instead of
+    # re-scanning the status strings
+    low_nutrients = grades.count(0)
+    high_nutrients = grades.count(2)
+    ph_issues = ph_status in ('Too Acidic', 'Too Alkaline')
+
     if low_nutrients >= 2 or ph_issues:
-        assessment['overall_health'] = 'Poor'
+        overall_health = 'Poor'
     elif low_nutrients == 1 or high_nutrients >= 1:
-        assessment['overall_health'] = 'Fair'
+        overall_health = 'Fair'
     else:
-        assessment['overall_health'] = 'Good'
-    
-    return assessment
+        overall_health = 'Good'
+
+    return SoilAssessment(
+        overall_health=overall_health,
+        nitrogen=_NUTRIENT_LABELS[grades[0]],
+        phosphorus=_NUTRIENT_LABELS[grades[1]],
+        potassium=_NUTRIENT_LABELS[grades[2]],
+        ph_status=ph_status,
+        recommendations=tuple(recommendations),
+    )
 
 
 def calculate_fertilizer_requirement(n: float, p: float, k: float, target_yield: float) -> Dict:
@@ -174,66 +329,191 @@ def calculate_fertilizer_requirement(n: float, p: float, k: float, target_yield:
     }
 
 
-def get_weather_risk_assessment(temp: float, rainfall: float, humidity: float) -> Dict:
-    """
-    Assess weather-related risks for crop production
-    
-    Args:
-        temp (float): Average temperature in Celsius
-        rainfall (float): Total rainfall in mm
-        humidity (float): Average humidity percentage
-    
-    Returns:
-        dict: Weather risk assessment
-    """
-    risks = []
-    risk_level = 'Low'
-    
+# Risk/recommendation messages indexed by the bit position their condition
+# sets in the mask kernels below; the kernels stay pure float/int work so
+# Numba can compile them in nopython mode
+_RISK_LEVELS = ('Low', 'Medium', 'High')
+_RISK_MESSAGES = (
+    "Frost risk - protect sensitive crops",
+    "Heat stress - provide shade/irrigation",
+    "High temperature - monitor crop stress",
+    "Drought conditions - irrigation critical",
+    "Excess rainfall - drainage and fungal disease risk",
+    "High rainfall - monitor for waterlogging",
+    "High humidity - fungal disease risk",
+    "Low humidity - plant water stress",
+    "Hot & humid - pest and disease pressure",
+)
+_REC_MESSAGES = (
+    ("Install shade nets or increase irrigation frequency",
+     "Schedule field operations for early morning or late evening"),
+    ("Install drip irrigation system for water efficiency",
+     "Apply mulch to conserve soil moisture"),
+    ("Ensure proper field drainage",
+     "Apply preventive fungicide sprays"),
+    ("Improve air circulation between crop rows",
+     "Monitor for pest and disease outbreak"),
+    ("Use row covers or polytunnels for protection",
+     "Delay sowing until soil temperature rises"),
+)
+
+
+@njit(cache=True)
+def _weather_risk_mask(temp, rainfall, humidity):
+    """Return (risk bitmask, risk level code: 0=Low 1=Medium 2=High)"""
+    mask = 0
+    level = 0
     # Temperature risks
     if temp < 10:
-        risks.append("Frost risk - protect sensitive crops")
-        risk_level = 'High'
+        mask |= 1
+        level = 2
     elif temp > 40:
-        risks.append("Heat stress - provide shade/irrigation")
-        risk_level = 'High'
+        mask |= 2
+        level = 2
     elif temp > 35:
-        risks.append("High temperature - monitor crop stress")
-        risk_level = 'Medium'
-    
+        mask |= 4
+        if level < 1:
+            level = 1
     # Rainfall risks
     if rainfall < 500:
-        risks.append("Drought conditions - irrigation critical")
-        risk_level = 'High' if risk_level != 'High' else 'High'
+        mask |= 8
+        level = 2
     elif rainfall > 2500:
-        risks.append("Excess rainfall - drainage and fungal disease risk")
-        risk_level = 'High' if risk_level != 'High' else 'High'
+        mask |= 16
+        level = 2
     elif rainfall > 2000:
-        risks.append("High rainfall - monitor for waterlogging")
-        risk_level = 'Medium' if risk_level == 'Low' else risk_level
-    
+        mask |= 32
+        if level < 1:
+            level = 1
     # Humidity risks
     if humidity > 85:
-        risks.append("High humidity - fungal disease risk")
-        risk_level = 'Medium' if risk_level == 'Low' else risk_level
+        mask |= 64
+        if level < 1:
+            level = 1
     elif humidity < 30:
-        risks.append("Low humidity - plant water stress")
-        risk_level = 'Medium' if risk_level == 'Low' else risk_level
-    
+        mask |= 128
+        if level < 1:
+            level = 1
     # Combined conditions
     if temp > 30 and humidity > 80:
-        risks.append("Hot & humid - pest and disease pressure")
-        risk_level = 'High'
-    
-    if not risks:
-        risks.append("Favorable weather conditions")
-    
+        mask |= 256
+        level = 2
+    return mask, level
+
+
+@njit(cache=True)
+def _weather_recs_mask(temp, rainfall, humidity):
+    """Return a bitmask of which recommendation groups apply"""
+    mask = 0
+    if temp > 35:
+        mask |= 1
+    if rainfall < 600:
+        mask |= 2
+    if rainfall > 2000:
+        mask |= 4
+    if humidity > 80:
+        mask |= 8
+    if temp < 15:
+        mask |= 16
+    return mask
+
+
+# pH status codes used by the fused scoring kernel
+_PH_LABELS = ('Too Acidic', 'Acceptable', 'Optimal', 'Too Alkaline')
+
+
+@njit(cache=True)
+def _score_row(n, p, k, ph, temp, rainfall, humidity, yield_value):
+    """Fused threshold kernel: every status code for one row, packed into
+    a single int64 so scoring crosses the Python boundary once.
+
+    Layout: bits 0-1 N grade, 2-3 P grade, 4-5 K grade, 6-7 pH code,
+    8-9 yield category, 10-11 weather risk level.
+    """
+    out = 0
+    # Nutrient grades (0=Low, 1=Adequate, 2=High)
+    out |= 0 if n < 200 else (2 if n > 400 else 1)
+    out |= (0 if p < 15 else (2 if p > 50 else 1)) << 2
+    out |= (0 if k < 150 else (2 if k > 300 else 1)) << 4
+    # pH code (0=Too Acidic, 1=Acceptable, 2=Optimal, 3=Too Alkaline)
+    if ph < 5.5:
+        ph_code = 0
+    elif ph > 8.5:
+        ph_code = 3
+    elif 6.0 <= ph <= 7.5:
+        ph_code = 2
+    else:
+        ph_code = 1
+    out |= ph_code << 6
+    # Yield category (same strict-< bins as get_yield_category)
+    if yield_value < 1500:
+        yield_code = 0
+    elif yield_value < 3000:
+        yield_code = 1
+    elif yield_value < 4500:
+        yield_code = 2
+    else:
+        yield_code = 3
+    out |= yield_code << 8
+    # Weather risk level reuses the risk kernel
+    _, level = _weather_risk_mask(temp, rainfall, humidity)
+    out |= level << 10
+    return out
+
+
+def decode_row_score(packed: int) -> Dict:
+    """Decode a _score_row result into its status labels"""
     return {
-        'risk_level': risk_level,
-        'risks': risks,
-        'recommendations': get_weather_recommendations(temp, rainfall, humidity)
+        'nitrogen': _NUTRIENT_LABELS[packed & 3],
+        'phosphorus': _NUTRIENT_LABELS[(packed >> 2) & 3],
+        'potassium': _NUTRIENT_LABELS[(packed >> 4) & 3],
+        'ph_status': _PH_LABELS[(packed >> 6) & 3],
+        'yield_category': _YIELD_LABELS[(packed >> 8) & 3],
+        'risk_level': _RISK_LEVELS[(packed >> 10) & 3],
     }
 
 
+def score_summary_rows(n, p, k, ph, temp, rainfall, humidity, yields) -> List[Dict]:
+    """Score whole columns through the fused kernel - one kernel call and
+    one decode per row instead of routing each row through four helpers"""
+    return [
+        decode_row_score(_score_row(
+            float(n[i]), float(p[i]), float(k[i]), float(ph[i]),
+            float(temp[i]), float(rainfall[i]), float(humidity[i]),
+            float(yields[i])))
+        for i in range(len(yields))
+    ]
+
+
+def get_weather_risk_assessment(temp: float, rainfall: float, humidity: float) -> Dict:
+    """
+    Assess weather-related risks for crop production
+    
+    Args:
+        temp (float): Average temperature in Celsius
+        rainfall (float): Total rainfall in mm
+        humidity (float): Average humidity percentage
+    
+    Returns:
+        dict: Weather risk assessment
+    """
+    return assess_weather_risk(temp, rainfall, humidity).to_dict()
+
+
+def assess_weather_risk(temp: float, rainfall: float, humidity: float) -> WeatherRisk:
+    """Slots-object variant of get_weather_risk_assessment for hot paths"""
+    mask, level = _weather_risk_mask(temp, rainfall, humidity)
+    risks = tuple(msg for bit, msg in enumerate(_RISK_MESSAGES) if mask & (1 << bit))
+    if not risks:
+        risks = ("Favorable weather conditions",)
+
+    return WeatherRisk(
+        risk_level=_RISK_LEVELS[level],
+        risks=risks,
+        recommendations=tuple(get_weather_recommendations(temp, rainfall, humidity)),
+    )
+
+
 def get_weather_recommendations(temp: float, rainfall: float, humidity: float) -> List[str]:
     """
     Get weather-based agricultural recommendations
@@ -246,28 +526,11 @@ def get_weather_recommendations(temp: float, rainfall: float, humidity: float) -
     Returns:
         list: List of recommendations
     """
+    mask = _weather_recs_mask(temp, rainfall, humidity)
     recommendations = []
-    
-    if temp > 35:
-        recommendations.append("Install shade nets or increase irrigation frequency")
-        recommendations.append("Schedule field operations for early morning or late evening")
-    
-    if rainfall < 600:
-        recommendations.append("Install drip irrigation system for water efficiency")
-        recommendations.append("Apply mulch to conserve soil moisture")
-    
-    if rainfall > 2000:
-        recommendations.append("Ensure proper field drainage")
-        recommendations.append("Apply preventive fungicide sprays")
-    
-    if humidity > 80:
-        recommendations.append("Improve air circulation between crop rows")
-        recommendations.append("Monitor for pest and disease outbreak")
-    
-    if temp < 15:
-        recommendations.append("Use row covers or polytunnels for protection")
-        recommendations.append("Delay sowing until soil temperature rises")
-    
+    for bit, messages in enumerate(_REC_MESSAGES):
+        if mask & (1 << bit):
+            recommendations.extend(messages)
     return recommendations
 
 
@@ -283,30 +546,79 @@ def format_prediction_summary(prediction: float, input_data: Dict, weather_data:
     Returns:
         dict: Formatted summary with all recommendations
     """
+    # Pull each scalar out once - total_rainfall_mm and avg_temp_c were
+    # previously looked up twice apiece (irrigation keeps its historical
+    # default of 0 where the other consumers default to 1000)
+    rain = input_data.get('total_rainfall_mm')
+    temp = input_data.get('avg_temp_c', 25)
+    humidity = input_data.get('avg_humidity_percent', 65)
+    n = input_data.get('N', 200)
+    p = input_data.get('P', 30)
+    k = input_data.get('K', 200)
+    ph = input_data.get('pH', 7)
+
     summary = {
         'predicted_yield': prediction,
         'yield_category': get_yield_category(prediction),
-        'irrigation_advice': get_irrigation_recommendation(input_data.get('total_rainfall_mm', 0)),
-        'crop_cycle': suggest_crop_cycle(input_data.get('avg_temp_c', 25), input_data.get('total_rainfall_mm', 1000)),
-        'soil_health': get_soil_health_assessment(
-            input_data.get('N', 200),
-            input_data.get('P', 30),
-            input_data.get('K', 200),
-            input_data.get('pH', 7)
-        ),
-        'weather_risks': get_weather_risk_assessment(
-            input_data.get('avg_temp_c', 25),
-            input_data.get('total_rainfall_mm', 1000),
-            input_data.get('avg_humidity_percent', 65)
-        )
+        'irrigation_advice': get_irrigation_recommendation(rain if rain is not None else 0),
+        'crop_cycle': suggest_crop_cycle(temp, rain if rain is not None else 1000),
+        'soil_health': get_soil_health_assessment(n, p, k, ph),
+        'weather_risks': get_weather_risk_assessment(temp, rain if rain is not None else 1000, humidity)
     }
-    
+
     if weather_data:
         summary['weather_data'] = weather_data
-    
+
     return summary
 
 
+def format_prediction_summary_batch(predictions, input_df) -> List[Dict]:
+    """
+    Batch companion to format_prediction_summary for scoring many rows
+    (CSV uploads, dashboard grids)
+
+    Yield categorization runs as one np.digitize over the whole prediction
+    column; the nested per-row structures are filled by the (table-driven)
+    scalar helpers.
+
+    Args:
+        predictions: array-like of predicted yield values
+        input_df: DataFrame with N, P, K, pH and weather columns
+
+    Returns:
+        list: one summary dict per row, same shape as format_prediction_summary
+    """
+    predictions = np.asarray(predictions, dtype=np.float64)
+    yield_cats = np.take(_YIELD_LABELS, np.digitize(predictions, _YIELD_BINS))
+
+    def column(name, default):
+        if name in input_df.columns:
+            return input_df[name].to_numpy(dtype=np.float64)
+        return np.full(len(predictions), default)
+
+    n = column('N', 200)
+    p = column('P', 30)
+    k = column('K', 200)
+    ph = column('pH', 7)
+    temp = column('avg_temp_c', 25)
+    rain = column('total_rainfall_mm', 1000)
+    hum = column('avg_humidity_percent', 65)
+
+    irrigation = get_irrigation_recommendation_batch(rain)
+
+    summaries = []
+    for i in range(len(predictions)):
+        summaries.append({
+            'predicted_yield': float(predictions[i]),
+            'yield_category': yield_cats[i],
+            'irrigation_advice': irrigation[i],
+            'crop_cycle': suggest_crop_cycle(temp[i], rain[i]),
+            'soil_health': get_soil_health_assessment(n[i], p[i], k[i], ph[i]),
+            'weather_risks': get_weather_risk_assessment(temp[i], rain[i], hum[i])
+        })
+    return summaries
+
+
 def get_yield_category(yield_value: float) -> str:
     """
     Categorize yield value
@@ -317,14 +629,8 @@ def get_yield_category(yield_value: float) -> str:
     Returns:
         str: Yield category
     """
-    if yield_value < 1500:
-        return "Low Yield"
-    elif yield_value < 3000:
-        return "Medium Yield"
-    elif yield_value < 4500:
-        return "Good Yield"
-    else:
-        return "Excellent Yield"
+    # bisect_right matches the old strict < boundaries exactly
+    return _YIELD_LABELS[bisect_right(_YIELD_BINS, yield_value)]
 
 
 def validate_input_parameters(data: Dict) -> Dict:
@@ -338,39 +644,23 @@ def validate_input_parameters(data: Dict) -> Dict:
         dict: Validation result with success status and errors if any
     """
     errors = []
-    
-    # Check required fields
-    required_fields = ['N', 'P', 'K', 'pH', 'avg_temp_c', 'total_rainfall_mm', 'avg_humidity_percent']
-    for field in required_fields:
-        if field not in data or data[field] is None:
+
+    # Single pass over the specs: one dict lookup, one float() and two
+    # compares per field (the old version hashed and parsed each field
+    # twice, and one bad value used to mask the rest)
+    for field, lo, hi, message in _VALIDATION_SPECS:
+        value = data.get(field)
+        if value is None:
             errors.append(f"Missing required field: {field}")
-    
-    try:
-        # Validate ranges
-        if 'N' in data and (float(data['N']) < 0 or float(data['N']) > 1000):
-            errors.append("Nitrogen value should be between 0-1000 mg/kg")
-        
-        if 'P' in data and (float(data['P']) < 0 or float(data['P']) > 200):
-            errors.append("Phosphorus value should be between 0-200 mg/kg")
-        
-        if 'K' in data and (float(data['K']) < 0 or float(data['K']) > 1000):
-            errors.append("Potassium value should be between 0-1000 mg/kg")
-        
-        if 'pH' in data and (float(data['pH']) < 0 or float(data['pH']) > 14):
-            errors.append("pH value should be between 0-14")
-        
-        if 'avg_temp_c' in data and (float(data['avg_temp_c']) < -10 or float(data['avg_temp_c']) > 60):
-            errors.append("Temperature should be between -10°C to 60°C")
-        
-        if 'total_rainfall_mm' in data and (float(data['total_rainfall_mm']) < 0 or float(data['total_rainfall_mm']) > 5000):
-            errors.append("Rainfall should be between 0-5000 mm")
-        
-        if 'avg_humidity_percent' in data and (float(data['avg_humidity_percent']) < 0 or float(data['avg_humidity_percent']) > 100):
-            errors.append("Humidity should be between 0-100%")
-    
-    except ValueError as e:
-        errors.append("Invalid numeric values provided")
-    
+            continue
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            errors.append(f"Invalid numeric value for {field}")
+            continue
+        if not (lo <= value <= hi):
+            errors.append(message)
+
     return {
         'success': len(errors) == 0,
         'errors': errors
@@ -388,37 +678,20 @@ def generate_farming_tips(soil_data: Dict, weather_data: Dict) -> List[str]:
     Returns:
         list: List of farming tips
     """
-    tips = []
-    
-    # Soil-based tips
     n_level = float(soil_data.get('N', 200))
-    p_level = float(soil_data.get('P', 30))
-    k_level = float(soil_data.get('K', 200))
     ph_level = float(soil_data.get('pH', 7))
-    
-    if n_level < 200:
-        tips.append("🌿 Consider organic nitrogen sources like compost or vermicompost for sustainable soil improvement")
-    
-    if ph_level < 6.0:
-        tips.append("🧪 Apply agricultural lime 2-3 months before planting to improve soil pH")
-    elif ph_level > 8.0:
-        tips.append("🧪 Add organic matter or sulfur to reduce soil alkalinity")
-    
-    # Weather-based tips
     temp = float(weather_data.get('avg_temp_c', 25))
     rainfall = float(weather_data.get('total_rainfall_mm', 1000))
     humidity = float(weather_data.get('avg_humidity_percent', 65))
-    
-    if temp > 32 and humidity > 75:
-        tips.append("🦠 High temperature and humidity favor disease development - ensure good field ventilation")
-    
-    if rainfall < 700:
-        tips.append("💧 Consider drought-tolerant crop varieties and water-efficient irrigation methods")
-    elif rainfall > 1800:
-        tips.append("🌊 Ensure adequate drainage and consider raised bed cultivation")
-    
-    # General tips
-    tips.append("📅 Plan crop rotation to maintain soil health and reduce pest buildup")
-    tips.append("🌱 Use certified seeds and follow recommended spacing for optimal yield")
-    
-    return tips
\ No newline at end of file
+
+    # Pack the conditions into a bitmask over _CONDITIONAL_TIPS (same order
+    # as the old append cascade); the two general tips are a static tuple
+    mask = ((n_level < 200) << 0) \
+        | ((ph_level < 6.0) << 1) \
+        | ((ph_level > 8.0) << 2) \
+        | ((temp > 32 and humidity > 75) << 3) \
+        | ((rainfall < 700) << 4) \
+        | ((rainfall > 1800) << 5)
+
+    return [tip for i, tip in enumerate(_CONDITIONAL_TIPS) if mask >> i & 1] \
+        + list(_STATIC_TIPS)
\ No newline at end of file
@@ -10,10 +10,35 @@ Supported integrations (to be implemented):
 - AccuWeather API
 """
 
+import numpy as np
 import requests
 import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from requests.adapters import HTTPAdapter
+from types import MappingProxyType
+from urllib3.util.retry import Retry
+
+# One keep-alive session for all outbound API calls: pooled connections
+# skip the TCP+TLS handshake per request, and transient gateway errors
+# retry with backoff instead of surfacing immediately
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=(502, 503, 504)),
+)
+_SESSION = requests.Session()
+_SESSION.mount('http://', _adapter)
+_SESSION.mount('https://', _adapter)
+
+# OpenWeatherMap endpoint pieces, built once; only the dynamic keys are
+# merged into the frozen base params per call
+_OWM_URL = "http://api.openweathermap.org/data/2.5/weather"
+_OWM_BASE_PARAMS = MappingProxyType({'units': 'metric'})
 
 # Mock weather data for development
 MOCK_WEATHER_DATA = {
@@ -49,51 +74,156 @@ MOCK_WEATHER_DATA = {
     'West Bengal': {'temp': 25.8, 'rainfall': 1550, 'humidity': 74}
 }
 
+# Structure-of-arrays view of MOCK_WEATHER_DATA: one integer index plus
+# three contiguous float32 reads per lookup instead of a nested-dict copy,
+# and a layout that supports perturbing all states in one numpy call
+_STATE_INDEX = {state: i for i, state in enumerate(MOCK_WEATHER_DATA)}
+_TEMPS = np.array([v['temp'] for v in MOCK_WEATHER_DATA.values()], dtype=np.float32)
+_RAIN = np.array([v['rainfall'] for v in MOCK_WEATHER_DATA.values()], dtype=np.float32)
+_HUM = np.array([v['humidity'] for v in MOCK_WEATHER_DATA.values()], dtype=np.float32)
+
 # -------------------------------------------------------------------------
 # Core Weather Functions
 # -------------------------------------------------------------------------
 
+# Dashboards poll the same states every few seconds; a 10-minute TTL cache
+# on the public entry point cuts repeat API round trips (and mock recompute)
+_WEATHER_TTL_S = 600
+_WEATHER_CACHE_MAX = 256
+_weather_cache: Dict[tuple, tuple] = {}
+
+
 def get_current_weather(state: str, api_key: Optional[str] = None, use_mock: bool = True) -> Dict:
     """Fetch current weather data for a given state."""
+    key = (state, use_mock, api_key is not None)
+    now = time.time()
+    cached = _weather_cache.get(key)
+    if cached is not None and cached[0] > now:
+        result = dict(cached[1])
+        result['timestamp'] = datetime.now().isoformat()
+        return result
+
     if use_mock or api_key is None:
-        return get_mock_weather(state)
+        result = get_mock_weather(state)
     else:
-        return get_openweather_data(state, api_key)
+        result = get_openweather_data(state, api_key)
+
+    if len(_weather_cache) >= _WEATHER_CACHE_MAX:
+        # Drop expired entries first, then oldest-inserted if still full;
+        # pop() tolerates another thread evicting the same key concurrently
+        for stale in [k for k, (expires, _) in _weather_cache.items() if expires <= now]:
+            _weather_cache.pop(stale, None)
+        while len(_weather_cache) >= _WEATHER_CACHE_MAX:
+            try:
+                _weather_cache.pop(next(iter(_weather_cache)))
+            except (StopIteration, KeyError):
+                break
+    _weather_cache[key] = (now + _WEATHER_TTL_S, result)
+    return dict(result)
+
+
+def get_current_weather_batch(states: List[str], api_key: Optional[str] = None,
+                              use_mock: bool = True) -> Dict[str, Dict]:
+    """Fetch current weather for several states at once.
+
+    Mock lookups are pure CPU, so they run inline; real API fetches overlap
+    on a small thread pool (sharing the pooled session), dropping wall time
+    from the sum of the round trips to roughly the slowest one.
+    """
+    if use_mock or api_key is None:
+        return {state: get_mock_weather(state) for state in states}
 
+    with ThreadPoolExecutor(max_workers=min(8, len(states) or 1)) as executor:
+        results = executor.map(lambda s: get_openweather_data(s, api_key), states)
+    return dict(zip(states, results))
 
-def get_mock_weather(state: str) -> Dict:
-    """Generate mock weather data for testing."""
-    if state in MOCK_WEATHER_DATA:
-        base_data = MOCK_WEATHER_DATA[state].copy()
+
+@lru_cache(maxsize=2048)
+def _mock_weather_cached(state: str, day: int, hour: int) -> tuple:
+    """Compute the seeded mock values once per (state, day, hour)."""
+    idx = _STATE_INDEX.get(state, -1)
+    if idx >= 0:
+        base_temp, base_rainfall, base_humidity = (
+            float(_TEMPS[idx]), float(_RAIN[idx]), float(_HUM[idx]))
     else:
-        base_data = {'temp': 25.0, 'rainfall': 1000, 'humidity': 65}
+        base_temp, base_rainfall, base_humidity = 25.0, 1000.0, 65.0
+
+    # A dedicated Random instance avoids mutating the process-wide RNG
+    # (same Mersenne sequence as random.seed, so the values are unchanged)
+    rng = random.Random(day + hour)
+    temp = round(base_temp + rng.uniform(-2, 2), 1)
+    rainfall = round(base_rainfall + rng.uniform(-100, 100), 1)
+    humidity = round(base_humidity + rng.uniform(-5, 5), 1)
+
+    # Ensure realistic bounds
+    return (max(0, min(50, temp)),
+            max(0, rainfall),
+            max(10, min(100, humidity)))
+
 
+def get_mock_weather(state: str) -> Dict:
+    """Generate mock weather data for testing."""
+    # The seed is (day, hour)-deterministic, so the perturbed values are
+    # cached per (state, day, hour) and only the timestamp is fresh
     current_time = datetime.now()
-    random.seed(current_time.day + current_time.hour)
+    temp, rainfall, humidity = _mock_weather_cached(
+        state, current_time.day, current_time.hour)
 
-    weather_data = {
-        'avg_temp_c': round(base_data['temp'] + random.uniform(-2, 2), 1),
-        'total_rainfall_mm': round(base_data['rainfall'] + random.uniform(-100, 100), 1),
-        'avg_humidity_percent': round(base_data['humidity'] + random.uniform(-5, 5), 1),
+    return {
+        'avg_temp_c': temp,
+        'total_rainfall_mm': rainfall,
+        'avg_humidity_percent': humidity,
         'timestamp': current_time.isoformat(),
         'source': 'mock_data',
         'state': state
     }
 
-    # Ensure realistic bounds
-    weather_data['avg_temp_c'] = max(0, min(50, weather_data['avg_temp_c']))
-    weather_data['total_rainfall_mm'] = max(0, weather_data['total_rainfall_mm'])
-    weather_data['avg_humidity_percent'] = max(10, min(100, weather_data['avg_humidity_percent']))
 
-    return weather_data
+def get_mock_weather_batch(states: List[str]) -> Dict[str, Dict]:
+    """Generate mock weather for many states in one vectorized perturbation.
+
+    The seeded deltas are drawn once (the scalar path's seed is
+    state-independent, so the same three draws cover every state - and the
+    results match get_mock_weather exactly), then perturbation, rounding
+    and clipping run over contiguous float arrays; dicts are only
+    assembled at the presentation boundary.
+    """
+    if not states:
+        return {}
+
+    current_time = datetime.now()
+    indices = np.array([_STATE_INDEX.get(s, -1) for s in states], dtype=np.intp)
+    known = indices >= 0
+    # float64 here mirrors the scalar path's float() conversion, so the
+    # one-decimal rounding lands on the same values
+    base_temp = np.where(known, _TEMPS[indices].astype(np.float64), 25.0)
+    base_rain = np.where(known, _RAIN[indices].astype(np.float64), 1000.0)
+    base_hum = np.where(known, _HUM[indices].astype(np.float64), 65.0)
+
+    rng = random.Random(current_time.day + current_time.hour)
+    temps = np.clip(np.round(base_temp + rng.uniform(-2, 2), 1), 0, 50)
+    rain = np.clip(np.round(base_rain + rng.uniform(-100, 100), 1), 0, None)
+    hum = np.clip(np.round(base_hum + rng.uniform(-5, 5), 1), 10, 100)
+
+    timestamp = current_time.isoformat()
+    return {
+        state: {
+            'avg_temp_c': float(temps[i]),
+            'total_rainfall_mm': float(rain[i]),
+            'avg_humidity_percent': float(hum[i]),
+            'timestamp': timestamp,
+            'source': 'mock_data',
+            'state': state
+        }
+        for i, state in enumerate(states)
+    }
 
 
 def get_openweather_data(state: str, api_key: str) -> Dict:
     """Fetch weather data from OpenWeatherMap API."""
     try:
-        base_url = "http://api.openweathermap.org/data/2.5/weather"
-        params = {'q': f"{state},IN", 'appid': api_key, 'units': 'metric'}
-        response = requests.get(base_url, params=params, timeout=10)
+        params = {**_OWM_BASE_PARAMS, 'q': f"{state},IN", 'appid': api_key}
+        response = _SESSION.get(_OWM_URL, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
 
@@ -134,11 +264,11 @@ def validate_weather_data(weather_data: Dict) -> bool:
 def get_weather_by_coordinates(lat: float, lon: float, api_key: Optional[str] = None, use_mock: bool = True) -> Dict:
     """Fetch current weather data using latitude and longitude."""
     if use_mock or api_key is None:
-        random.seed(int(lat * lon))
+        rng = random.Random(int(lat * lon))
         return {
-            'avg_temp_c': round(20 + random.uniform(-3, 5), 1),
-            'total_rainfall_mm': round(1000 + random.uniform(-200, 200), 1),
-            'avg_humidity_percent': round(60 + random.uniform(-10, 10), 1),
+            'avg_temp_c': round(20 + rng.uniform(-3, 5), 1),
+            'total_rainfall_mm': round(1000 + rng.uniform(-200, 200), 1),
+            'avg_humidity_percent': round(60 + rng.uniform(-10, 10), 1),
             'timestamp': datetime.now().isoformat(),
             'source': 'mock_data_latlon',
             'latitude': lat,
@@ -146,9 +276,8 @@ def get_weather_by_coordinates(lat: float, lon: float, api_key: Optional[str] =
         }
 
     try:
-        base_url = "http://api.openweathermap.org/data/2.5/weather"
-        params = {'lat': lat, 'lon': lon, 'appid': api_key, 'units': 'metric'}
-        response = requests.get(base_url, params=params, timeout=10)
+        params = {**_OWM_BASE_PARAMS, 'lat': lat, 'lon': lon, 'appid': api_key}
+        response = _SESSION.get(_OWM_URL, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
 